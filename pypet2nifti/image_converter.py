@@ -14,15 +14,114 @@ import pydicom
 import nibabel as nib
 import numpy as np
 import subprocess
+import shutil
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
 from .petsidecar import sidecar_template_custom
+from .scanner_filter import scanners
 import json
-import importlib.resources as pkg_resources
-import pypet2nifti
 from scipy.ndimage import gaussian_filter1d
 
 
+# numba is an optional dependency and slow to import, the kernel is compiled on first use
+_correlate_axis1_numba = None
+
+
+def _get_correlate_axis1_numba():
+    """
+    Builds the numba kernel used by Converter.gaussian3d_numba on the first call and caches it.
+
+    Returns:
+        function: Compiled kernel.
+
+    Raises:
+        ImportError: If numba is not installed.
+    """
+    global _correlate_axis1_numba
+    if _correlate_axis1_numba is None:
+        from numba import njit, prange
+
+        @njit(parallel=True, fastmath=True, cache=True)
+        def correlate_axis1(src, dst, kernel):
+            """
+            Correlates a C-contiguous 3D array with a 1D kernel along its middle axis using 'reflect'
+            boundaries. The innermost loop runs over the contiguous last axis.
+
+            Args:
+                src (numpy.ndarray): 3D input array.
+                dst (numpy.ndarray): 3D output array of the same shape as src.
+                kernel (numpy.ndarray): Symmetric 1D kernel of odd length.
+            """
+            nouter, n, ninner = src.shape
+            radius = kernel.size // 2
+            for p in prange(nouter * n):
+                o = p // n
+                x = p % n
+                for i in range(ninner):
+                    dst[o, x, i] = 0.0
+                for j in range(kernel.size):
+                    idx = x + j - radius
+                    if idx < 0 or idx >= n:
+                        idx = idx % (2 * n)
+                        if idx >= n:
+                            idx = 2 * n - idx - 1
+                    weight = kernel[j]
+                    for i in range(ninner):
+                        dst[o, x, i] += weight * src[o, idx, i]
+
+        _correlate_axis1_numba = correlate_axis1
+    return _correlate_axis1_numba
+
+
+# DICOM tags consumed by Converter and dicom_json, all other elements are skipped when reading headers
+DICOM_HEADER_TAGS = [
+    'InstanceNumber', 'PatientID', 'StudyDate', 'AcquisitionTime',
+    'Manufacturer', 'ManufacturerModelName', 'SoftwareVersions',
+    'SeriesDescription', 'ProtocolName', 'SeriesNumber', 'ImageType',
+    'RadiopharmaceuticalInformationSequence', 'DoseCalibrationFactor', 'Units',
+    'DecayCorrection', 'AttenuationCorrectionMethod', 'ReconstructionMethod',
+    'NumberOfSlices', 'NumberOfTimeSlots', 'NumberOfTimeSlices',
+    'DecayFactor', 'FrameReferenceTime', 'ActualFrameDuration',
+    'SliceThickness', 'ImageOrientationPatient'
+]
+
+# DICOM tags needed from every slice to sort the series and collect the frame timing
+DICOM_FRAME_TAGS = ['InstanceNumber', 'DecayFactor', 'FrameReferenceTime', 'ActualFrameDuration']
+
+
+class EcatSubheaders:
+    """
+    ECAT subheaders stored as a structured numpy array with one record per frame.
+
+    Indexing with a field name returns that field for all frames as an array. Indexing with
+    an integer returns the subheader of that frame as a dictionary, as the list of
+    dictionaries previously used for subheaders did.
+
+    Attributes:
+        records (numpy.ndarray): Structured array of the subheaders.
+    """
+
+    def __init__(self, records):
+        self.records = records
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.records[key]
+        if isinstance(key, (int, np.integer)):
+            record = self.records[key]
+            return {name: record[name].item() for name in self.records.dtype.names}
+        return EcatSubheaders(self.records[key])
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        for i in range(len(self.records)):
+            yield self[i]
+
+
 class Converter:
     """
     A class to convert DICOM or ECAT images to NIfTI format and generate JSON metadata.
@@ -144,25 +243,24 @@ class Converter:
                 if np.any(np.array(self.filter_size) > 8):
                     raise ValueError("Filter size in any dimensions should not be greater than 8")
             elif self.scanner_type is not None:
-                with pkg_resources.open_text(pypet2nifti, 'scanner_filter.json') as f:
-                    scanners = json.load(f)
-                    if self.scanner_type in scanners.keys():
-                        self.filter_size = scanners[self.scanner_type]
-                    else:
-                        raise Exception(f"Error: Not a valid scanner type. Scanner should be one of the following:\n{list(scanners.keys())}")
+                if self.scanner_type in scanners:
+                    self.filter_size = list(scanners[self.scanner_type])
+                else:
+                    raise Exception(f"Error: Not a valid scanner type. Scanner should be one of the following:\n{list(scanners.keys())}")
             else:
                 raise Exception("Error: Provide scanner type or a valid filter size for apply smoothing")
             
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def check_for_dcm2niix():
         """
         Checks if the dcm2niix tool is installed on the system.
+        The PATH lookup is done once per process and cached for later Converter instances.
 
         Returns:
-            int: Status code of the dcm2niix command (0 if present).
+            int: Status code of the check (0 if present, 1 otherwise).
         """
-        check = subprocess.run(["dcm2niix", "-h"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return check.returncode
+        return 0 if shutil.which("dcm2niix") is not None else 1
     
     @staticmethod
     def convertdatetime(timestamp):
@@ -190,47 +288,78 @@ class Converter:
         Returns:
             bool: True if at least one DICOM file is found, False otherwise.
         """
-        return any(
-            self.is_dicom_file(self.input_folder / f)
-            for f in os.listdir(self.input_folder)
-            if os.path.isfile(self.input_folder / f)
-        )
+        with os.scandir(self.input_folder) as entries:
+            return any(
+                self.is_dicom_file(entry.path)
+                for entry in entries
+                if entry.is_file()
+            )
 
-    def is_dicom_file(self, file_path):
+    def is_dicom_file(self, file_path, strict=True):
         """
         Helper function to determine if a file is a valid DICOM file.
+        Only the 128 byte preamble and the 'DICM' prefix are read, the header is not parsed.
 
         Args:
             file_path (Path): Path to the file to be checked.
+            strict (bool, optional): If False, files without the standard preamble are
+                parsed with pydicom as a fallback. Defaults to True.
 
         Returns:
             bool: True if the file is a valid DICOM, False otherwise.
         """
         try:
-            pydicom.dcmread(file_path, stop_before_pixels=True)
-            return True
-        except pydicom.errors.InvalidDicomError:
+            with open(file_path, 'rb') as fh:
+                fh.seek(128)
+                if fh.read(4) == b'DICM':
+                    return True
+        except OSError:
+            return False
+        if strict:
             return False
+        try:
+            dicom_header = pydicom.dcmread(file_path, stop_before_pixels=True, force=True)
+            return 'SOPClassUID' in dicom_header
         except Exception:
             return False  # Handle other potential exceptions gracefully
 
     def extract_dicom_headers(self):
         """
         Extracts DICOM headers from files in the input folder and sorts them by instance number.
+        Only the per-frame tags are read from every file, the first header is read with all
+        tags used for the sidecar.
 
         Returns:
             list: A sorted list of DICOM headers.
         """
-        files = [f for f in os.listdir(self.input_folder) if os.path.isfile(os.path.join(self.input_folder, f))]
-        dicom_headers = []
-        for f in files:
-            try:
-                dicom_header = pydicom.dcmread(os.path.join(self.input_folder, f), stop_before_pixels=True)
-                dicom_headers.append(dicom_header)
-            except pydicom.errors.InvalidDicomError:
-                pass
+        with os.scandir(self.input_folder) as entries:
+            files = [entry.path for entry in entries if entry.is_file()]
+        # Reading headers is I/O bound, so the files are read concurrently
+        read_frame_header = functools.partial(self.read_dicom_header, specific_tags=DICOM_FRAME_TAGS)
+        with ThreadPoolExecutor() as executor:
+            dicom_headers = [h for h in executor.map(read_frame_header, files) if h is not None]
         sorted_dicom_headers = sorted(dicom_headers, key=lambda x: x.InstanceNumber)
+        if sorted_dicom_headers:
+            sorted_dicom_headers[0] = self.read_dicom_header(sorted_dicom_headers[0].filename)
         return sorted_dicom_headers
+
+    @staticmethod
+    def read_dicom_header(file_path, specific_tags=DICOM_HEADER_TAGS):
+        """
+        Reads the header of a DICOM file without the pixel data.
+
+        Args:
+            file_path (str): Path to the DICOM file.
+            specific_tags (list, optional): Tags to parse, all other elements are skipped.
+                Defaults to DICOM_HEADER_TAGS.
+
+        Returns:
+            pydicom.Dataset: DICOM header, or None if the file is not a valid DICOM.
+        """
+        try:
+            return pydicom.dcmread(file_path, stop_before_pixels=True, specific_tags=specific_tags)
+        except pydicom.errors.InvalidDicomError:
+            return None
     
     def extract_ecat_header_subheaders(self):
         """
@@ -238,7 +367,7 @@ class Converter:
         
         Returns:
             header: Ecat header information
-            subheaders: Ecat sub-headers information
+            subheaders: Ecat sub-headers information as EcatSubheaders
         """
         try:
             ecat_data = nib.ecat.load(self.source_data)
@@ -248,22 +377,25 @@ class Converter:
         header = {}
         for key, value in dict(ecat_data.header).items():
             if isinstance(value, np.ndarray):
-                header[key] = value.tolist().decode(errors='ignore') if isinstance(value.tolist(), bytes) else value.tolist()
-            elif isinstance(value, bytes):
-                header[key] = value.decode(errors='ignore')
+                value = value.tolist()
+            header[key] = value.decode(errors='ignore') if isinstance(value, bytes) else value
+
+        # Subheaders are kept as one structured array (one record per frame) for column access.
+        # Byte string fields are decoded a whole column at a time.
+        raw_subheaders = np.stack(ecat_data.get_subheaders().subheaders)
+        raw_dtype = raw_subheaders.dtype
+        string_fields = {name for name in raw_dtype.names if raw_dtype[name].kind == 'S'}
+        subheaders = np.empty(raw_subheaders.shape, dtype=[
+            (name, f'U{raw_dtype[name].itemsize}' if name in string_fields else raw_dtype[name])
+            for name in raw_dtype.names
+        ])
+        for name in raw_dtype.names:
+            if name in string_fields:
+                subheaders[name] = np.char.decode(raw_subheaders[name], errors='ignore')
             else:
-                header[key] = value
-
-        subheaders = []
-        for subheader in ecat_data.get_subheaders().subheaders:
-            holder = {}
-            subheader_values = subheader.tolist()
-            subheader_dtypes = subheader.dtype.descr
-            for i in range(len(subheader_values)):
-                holder[subheader_dtypes[i][0]] = subheader_values[i].decode(errors='ignore') if isinstance(subheader_values[i], bytes) else subheader_values[i]
-            subheaders.append(holder)
+                subheaders[name] = raw_subheaders[name]
         
-        return header, subheaders
+        return header, EcatSubheaders(subheaders)
     
     @staticmethod
     def fwhm_to_sigma(fwhm):
@@ -278,6 +410,58 @@ class Converter:
         """
         return fwhm / np.sqrt(8 * np.log(2))
 
+    @staticmethod
+    def gaussian_kernel1d(sigma, truncate):
+        """
+        Build a normalized 1D Gaussian kernel matching the one used by scipy.ndimage.gaussian_filter1d.
+
+        Args:
+            sigma (float): Standard deviation of the kernel in voxels.
+            truncate (float): Truncate the kernel at this many standard deviations.
+
+        Returns:
+            numpy.ndarray: 1D Gaussian kernel of length 2 * radius + 1.
+        """
+        radius = int(truncate * sigma + 0.5)
+        x = np.arange(-radius, radius + 1)
+        kernel = np.exp(-0.5 * (x / sigma) ** 2)
+        return kernel / kernel.sum()
+
+    @classmethod
+    def gaussian3d_numba(cls, data, sigma_voxel, truncate):
+        """
+        Applies a separable 3D Gaussian filter using numba compiled kernels running in parallel.
+        A 4D input is filtered frame by frame along the three spatial axes.
+
+        Args:
+            data (numpy.ndarray): 3D or 4D image data.
+            sigma_voxel (list): Sigma of the Gaussian in voxels for each spatial axis.
+            truncate (float): Truncate the kernel at this many standard deviations.
+
+        Returns:
+            numpy.ndarray: Smoothed data as float32.
+
+        Raises:
+            ImportError: If numba is not installed.
+        """
+        try:
+            correlate_axis1 = _get_correlate_axis1_numba()
+        except ImportError:
+            raise ImportError("numba is required for method='numba'. Install it with `pip install numba`")
+        frames = data[..., None] if data.ndim == 3 else data
+        # Frames first and float32 so that every pass streams through contiguous memory.
+        # Always a copy, the passes below overwrite buf.
+        buf = np.array(np.moveaxis(frames, 3, 0), dtype=np.float32, order='C')
+        tmp = np.empty_like(buf)
+        nt, nx, ny, nz = buf.shape
+        views = [(nt, nx, ny * nz), (nt * nx, ny, nz), (nt * nx * ny, nz, 1)]
+        for axis in range(3):
+            kernel = cls.gaussian_kernel1d(sigma_voxel[axis], truncate).astype(np.float32)
+            correlate_axis1(buf.reshape(views[axis]), tmp.reshape(views[axis]), kernel)
+            buf, tmp = tmp, buf
+        smoothed_data = np.moveaxis(buf, 0, 3)
+        return smoothed_data[..., 0] if data.ndim == 3 else smoothed_data
+
     @staticmethod
     def check_img_orientation(affine, desired_orientation=("L", "A", "S")):
         """
@@ -336,10 +520,17 @@ class Converter:
         except Exception as e:
             raise RuntimeError(f"An error occurred while reorienting the image: {e}")
 
-    def reset_origin(self):
+    def reset_origin(self, img=None):
         """
         This function reset's the origin to the center of the FOV. 
 
+        Args:
+            img (nib.Nifti1Image, optional): Image to process in memory. If None, the output
+                NIfTI file is loaded and overwritten with the result. Defaults to None.
+
+        Returns:
+            nib.Nifti1Image: Image with the origin at the center of the FOV in LAS orientation.
+
         Raises:
             fe: FileNotFound Error
             ie: ImageFileError from nibabel exceptions.
@@ -347,23 +538,25 @@ class Converter:
             ValueError: Error in input values
         """
         file_path = pathlib.Path(self.output_folder) / f"{self.output_file}.nii.gz"
-        try:
-            img = nib.load(file_path)
-        except FileNotFoundError as fe:
-            raise fe
-        except nib.filebasedimages.ImageFileError as ie:
-            raise ie
-        except Exception as e:
-            raise e
+        save_to_file = img is None
+        if save_to_file:
+            try:
+                img = nib.load(file_path)
+            except FileNotFoundError as fe:
+                raise fe
+            except nib.filebasedimages.ImageFileError as ie:
+                raise ie
+            except Exception as e:
+                raise e
         
         try:
             data_shape = img.shape
-            affine = img.affine()
+            affine = img.affine
             center_voxel = np.array(data_shape[:3]) / 2
             center_mm = nib.affines.apply_affine(affine, center_voxel)
-            new_affine = affine.copy
+            new_affine = affine.copy()
             new_affine[:3, 3] -= center_mm
-            resetori_img = nib.Nifti1Image(img.get_fdata(), new_affine)
+            resetori_img = nib.Nifti1Image(np.asanyarray(img.dataobj, dtype=np.float32), new_affine)
         except Exception as e:
             raise e
 
@@ -376,28 +569,47 @@ class Converter:
         else:
             reori_img = resetori_img
         
-        try:
-            nib.save(reori_img, file_path)
-        except nib.filebasedimages.ImageFileError as ie:
-            raise ie
-        except Exception as e:
-            raise e
+        if save_to_file:
+            try:
+                nib.save(reori_img, file_path)
+            except nib.filebasedimages.ImageFileError as ie:
+                raise ie
+            except Exception as e:
+                raise e
+        return reori_img
 
-    def filter_image(self):
+    def filter_image(self, method='direct', img=None):
         """
         This function filters the image so that the effect smoothing is 8x8x8 mm3. This is done to 
         harmonize the data across different scanners. 
 
+        Args:
+            method (str, optional): 'direct' applies separable 1D convolutions along the spatial axes
+                one frame at a time to limit memory use, 'fft' applies a single FFT based 3D convolution
+                which is faster for large kernels, 'numba' applies parallel separable convolutions compiled
+                with numba (optional dependency). 'fft' and 'numba' filter all frames of a 4D image at once.
+                Defaults to 'direct'.
+            img (nib.Nifti1Image, optional): Image to filter in memory. If None, the output
+                NIfTI file is loaded and overwritten with the result. Defaults to None.
+
+        Returns:
+            nib.Nifti1Image: Smoothed image.
+
         Raises:
             fe: FileNotFound Error
             ie: ImageFileError from nibabel exceptions.
             e: Other Exceptions
             ValueError: Error in input values
         """
+        if method not in ('direct', 'fft', 'numba'):
+            raise ValueError(f"Invalid filter method {method}. Method should be 'direct', 'fft' or 'numba'")
         file_path = pathlib.Path(self.output_folder) / f"{self.output_file}.nii.gz"
+        save_to_file = img is None
         try:
-            img = nib.load(file_path)
-            data = img.get_fdata()
+            if save_to_file:
+                # Keep the gzip stream open so reading frame by frame does not decompress
+                # the file from the start for every frame
+                img = nib.load(file_path, keep_file_open=True)
         except FileNotFoundError as fe:
             raise fe
         except nib.filebasedimages.ImageFileError as ie:
@@ -406,64 +618,108 @@ class Converter:
             raise e    
         fwhm = np.array(self.filter_size)
         voxel_size = img.header.get_zooms()[:3]
-        sigma_x = self.fwhm_to_sigma(fwhm[0]) / voxel_size[0]
-        sigma_y = self.fwhm_to_sigma(fwhm[1]) / voxel_size[1]
-        sigma_z = self.fwhm_to_sigma(fwhm[2]) / voxel_size[2]
+        sigma_voxel = [self.fwhm_to_sigma(fwhm[i]) / voxel_size[i] for i in range(3)]
         alpha = 0.02
         truncate = np.sqrt(-2 * np.log(alpha))
         try:
-            if data.ndim == 3:
-                smoothed_data = gaussian_filter1d(data, sigma=sigma_x, axis=0, truncate=truncate)
-                smoothed_data = gaussian_filter1d(smoothed_data, sigma=sigma_y, axis=1, truncate=truncate)
-                smoothed_data = gaussian_filter1d(smoothed_data, sigma=sigma_z, axis=2, truncate=truncate)
-            elif data.ndim == 4:
-                smoothed_data = np.zeros_like(data)
-                for t in range (data.shape[3]):
-                    smoothed_data[..., t] = gaussian_filter1d(data[..., t], sigma=sigma_x, axis=0, truncate=truncate)
-                    smoothed_data[..., t] = gaussian_filter1d(smoothed_data[..., t], sigma=sigma_y, axis=1, truncate=truncate)
-                    smoothed_data[..., t] = gaussian_filter1d(smoothed_data[..., t], sigma=sigma_z, axis=2, truncate=truncate)
-            else:
+            if len(img.shape) not in (3, 4):
                 raise ValueError("Input NIFTI image must be 3D or 4D.")
+            # float32 is enough for PET data and halves the memory traffic of the filter
+            if method == 'direct':
+                # Frames are streamed from img.dataobj one at a time, so only the output volume
+                # and two frame buffers are held in memory. The passes alternate between the buffers.
+                is_4d = len(img.shape) == 4
+                smoothed_data = np.empty(img.shape, dtype=np.float32, order='F')
+                frame = np.empty(img.shape[:3], dtype=np.float32, order='F')
+                buffer = np.empty_like(frame)
+                for t in range(img.shape[3] if is_4d else 1):
+                    frame[...] = img.dataobj[..., t] if is_4d else np.asanyarray(img.dataobj)
+                    output = smoothed_data[..., t] if is_4d else smoothed_data
+                    gaussian_filter1d(frame, sigma=sigma_voxel[0], axis=0, truncate=truncate, output=buffer)
+                    gaussian_filter1d(buffer, sigma=sigma_voxel[1], axis=1, truncate=truncate, output=frame)
+                    gaussian_filter1d(frame, sigma=sigma_voxel[2], axis=2, truncate=truncate, output=output)
+            elif method == 'numba':
+                smoothed_data = self.gaussian3d_numba(np.asanyarray(img.dataobj, dtype=np.float32), sigma_voxel, truncate)
+            else:
+                # Imported here, scipy.signal is slow to import and only needed for this method
+                from scipy.signal import fftconvolve
+                data = np.asanyarray(img.dataobj, dtype=np.float32)
+                kernels = [self.gaussian_kernel1d(sigma_voxel[i], truncate) for i in range(3)]
+                kernel = np.einsum('i,j,k->ijk', *kernels)
+                radius = [len(k) // 2 for k in kernels]
+                # Symmetric padding reproduces the 'reflect' boundary of gaussian_filter1d
+                pad_width = [(r, r) for r in radius] + [(0, 0)] * (data.ndim - 3)
+                padded = np.pad(data, pad_width, mode='symmetric')
+                if data.ndim == 4:
+                    kernel = kernel[..., None]
+                smoothed_data = fftconvolve(padded, kernel, mode='valid', axes=(0, 1, 2))
         except Exception as e:
             raise e
         try:
-            smoothed_img = nib.Nifti1Image(smoothed_data, img.affine, img.header)
-            nib.save(smoothed_img, file_path)
+            smoothed_img = nib.Nifti1Image(smoothed_data.astype(np.float32, copy=False), img.affine, img.header)
+            if save_to_file:
+                nib.save(smoothed_img, file_path)
         except nib.filebasedimages.ImageFileError as ie:
             raise ie
         except Exception as e:
             raise e
+        return smoothed_img
 
     def make_nifti(self):
         """
         Converts the DICOM or ECAT data to NIfTI format using dcm2niix.
         If `apply_filter = True`, applies smoothing with appropriate smoothing kernel 
         based on the `scanner_type` provided to harmonize the data to 8x8x8 filter.
+        The output is compressed with pigz if it is available on PATH, otherwise with nibabel.
 
         Raises:
             FileNotFoundError: If the NIfTI output file is not created.
             RuntimeError: If there is an error during the conversion process.
         """
 
-        if self.input_format == 'dicom' or self.input_format == 'ecat':
-            cmd = ["dcm2niix", "-b", "n", "-z", "y", "-o", str(self.output_folder), "-f", self.output_file, str(self.source_data)]
-            
+        if self.input_format != 'dicom' and self.input_format != 'ecat':
+            raise Exception("ERROR: Something is wrong.\nIf input is not DICOM or ECAT, the program should have errored out before executing this function.")
+
+        # dcm2niix writes an uncompressed intermediate, the final image is compressed once on save.
+        # '-w 1' overwrites instead of renaming when a previous output exists.
+        cmd = ["dcm2niix", "-b", "n", "-z", "n", "-w", "1", "-o", str(self.output_folder), "-f", self.output_file, str(self.source_data)]
+        intermediate_path = pathlib.Path(self.output_folder) / f"{self.output_file}.nii"
+        output_path = pathlib.Path(self.output_folder) / f"{self.output_file}.nii.gz"
+        try:
             try:
-                subprocess.run(cmd, check=True, capture_output=True)
+                # stdout is never used, only stderr is kept for the error message
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             except subprocess.CalledProcessError as e:
-                raise RuntimeError(f"Error during DICOM to NIFTI conversion: {e}")
-            output_path = pathlib.Path(self.output_folder) / f"{self.output_file}.nii.gz"
-            if not output_path.exists():
+                raise RuntimeError(f"Error during DICOM to NIFTI conversion: {e}\n{e.stderr.decode(errors='ignore')}")
+            if not intermediate_path.exists():
                 raise FileNotFoundError("Output file not created")
-        else:
-            raise Exception("ERROR: Something is wrong.\nIf input is not DICOM or ECAT, the program should have errored out before executing this function.")
-        
-        # Reset origin to center of the Image
-        self.reset_origin()
 
-        # Apply smoothing
-        if self.apply_filter:
-            self.filter_image()
+            # Reset origin to center of the Image. The intermediate is read fully (no memmap)
+            # since it is overwritten or removed below.
+            img = self.reset_origin(img=nib.load(intermediate_path, mmap=False))
+
+            # Apply smoothing
+            if self.apply_filter:
+                img = self.filter_image(img=img)
+
+            pigz = shutil.which("pigz")
+            try:
+                if pigz is not None:
+                    # Parallel gzip: write uncompressed, then pigz replaces the .nii with the .nii.gz
+                    nib.save(img, intermediate_path)
+                    subprocess.run([pigz, "-f", "-p", str(os.cpu_count() or 1), str(intermediate_path)],
+                                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                else:
+                    nib.save(img, output_path)
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Error during compression of the NIFTI file: {e}\n{e.stderr.decode(errors='ignore')}")
+            except nib.filebasedimages.ImageFileError as ie:
+                raise ie
+            except Exception as e:
+                raise e
+        finally:
+            # The intermediate never outlives make_nifti, also when a step above failed
+            intermediate_path.unlink(missing_ok=True)
 
     def make_json(self):
         """
@@ -508,45 +764,55 @@ class Converter:
         Returns:
             None
         """
-        sidecar_template_custom['Manufacturer'] = self.header[0].get('Manufracturer', None)
-        sidecar_template_custom['ManufacturersModelName'] = self.header[0].get('ManufacturerModelName', None)
-        sidecar_template_custom['SoftwareVersions'] = self.header[0].get('SoftwareVersions', None)
-        sidecar_template_custom['SeriesDescription'] = self.header[0].get('SeriesDescription', None)
-        sidecar_template_custom['ProtocolName'] = self.header[0].get('ProtocolName', None)
-        sidecar_template_custom['ImageType'] = list(self.header[0].get('ImageType', []))
-        sidecar_template_custom['SeriesNumber'] = self.header[0].get('SeriesNumber', None)
-        sidecar_template_custom['StudyDate'] = self.header[0].get('StudyDate', None)
-        sidecar_template_custom['AcquisitionTime'] = self.header[0].get('AcquisitionTime', None)
-        sidecar_template_custom['Radiopharmaceutical'] = self.tracer
-        sidecar_template_custom['RadionuclidePositronFraction'] = float(self.header[0].RadiopharmaceuticalInformationSequence[0].get('RadionuclidePositronFraction', None))
-        sidecar_template_custom['RadionuclideTotalDose'] = float(self.header[0].RadiopharmaceuticalInformationSequence[0].get('RadionuclideTotalDose', None))
-        sidecar_template_custom['RadionuclideHalfLife'] = float(self.header[0].RadiopharmaceuticalInformationSequence[0].get('RadionuclideHalfLife', None))
-        sidecar_template_custom['DoseCalibrationFactor'] = float(self.header[0].get('DoseCalibrationFactor', 1))
-        sidecar_template_custom['Units'] = self.header[0].get('Units', None)
-        sidecar_template_custom['DecayCorrection'] = self.header[0].get('DecayCorrection', None)
-        sidecar_template_custom['AttenuationCorrectionMethod'] = self.header[0].get('AttenuationCorrectionMethod', None)
-        sidecar_template_custom['ReconstructionMethod'] = self.header[0].get('ReconstructionMethod', None)
+        sidecar = dict(sidecar_template_custom)
+        sidecar['Manufacturer'] = self.header[0].get('Manufracturer', None)
+        sidecar['ManufacturersModelName'] = self.header[0].get('ManufacturerModelName', None)
+        sidecar['SoftwareVersions'] = self.header[0].get('SoftwareVersions', None)
+        sidecar['SeriesDescription'] = self.header[0].get('SeriesDescription', None)
+        sidecar['ProtocolName'] = self.header[0].get('ProtocolName', None)
+        sidecar['ImageType'] = list(self.header[0].get('ImageType', []))
+        sidecar['SeriesNumber'] = self.header[0].get('SeriesNumber', None)
+        sidecar['StudyDate'] = self.header[0].get('StudyDate', None)
+        sidecar['AcquisitionTime'] = self.header[0].get('AcquisitionTime', None)
+        sidecar['Radiopharmaceutical'] = self.tracer
+        sidecar['RadionuclidePositronFraction'] = float(self.header[0].RadiopharmaceuticalInformationSequence[0].get('RadionuclidePositronFraction', None))
+        sidecar['RadionuclideTotalDose'] = float(self.header[0].RadiopharmaceuticalInformationSequence[0].get('RadionuclideTotalDose', None))
+        sidecar['RadionuclideHalfLife'] = float(self.header[0].RadiopharmaceuticalInformationSequence[0].get('RadionuclideHalfLife', None))
+        sidecar['DoseCalibrationFactor'] = float(self.header[0].get('DoseCalibrationFactor', 1))
+        sidecar['Units'] = self.header[0].get('Units', None)
+        sidecar['DecayCorrection'] = self.header[0].get('DecayCorrection', None)
+        sidecar['AttenuationCorrectionMethod'] = self.header[0].get('AttenuationCorrectionMethod', None)
+        sidecar['ReconstructionMethod'] = self.header[0].get('ReconstructionMethod', None)
         nslices = self.header[0].NumberOfSlices
         if 'SUMMED' in list(self.header[0].get('ImageType', [])):
             nframes = self.header[0].NumberOfTimeSlots
         else:
             nframes = self.header[0].NumberOfTimeSlices
         nfiles = nslices * nframes
-        sidecar_template_custom['DecayFactor'] = [float(self.header[i].get('DecayFactor', 1)) for i in range(0, nfiles, nslices)]
-        sidecar_template_custom['FrameTimesStart'] = [(self.header[i].get('FrameReferenceTime', 0)) / 60000 for i in range(0, nfiles, nslices)]
-        sidecar_template_custom['FrameDuration'] = [(self.header[i].get('ActualFrameDuration', 0)) / 60000 for i in range(0, nfiles, nslices)]
-        sidecar_template_custom['FrameTimesEnd'] = [(self.header[i].get('FrameReferenceTime', 0) + self.header[i].get('ActualFrameDuration', 0)) / 60000 for i in range(0, nfiles, nslices)]
-        sidecar_template_custom['SliceThickness'] = float(self.header[0].get('SliceThickness', None))
-        sidecar_template_custom['ImageOrientationPatientDICOM'] = list(self.header[0].get('ImageOrientationPatient', []))
-        sidecar_template_custom['ConversionSoftwareVersion'] = 'v1.0.20220505'
-        sidecar_template_custom['PyPET2NIFTIVersion'] = '0.1'
+        decay_factor, frame_start, frame_duration, frame_end = [], [], [], []
+        for i in range(0, nfiles, nslices):
+            header = self.header[i]
+            frame_reference_time = header.get('FrameReferenceTime', 0)
+            actual_frame_duration = header.get('ActualFrameDuration', 0)
+            decay_factor.append(float(header.get('DecayFactor', 1)))
+            frame_start.append(frame_reference_time / 60000)
+            frame_duration.append(actual_frame_duration / 60000)
+            frame_end.append((frame_reference_time + actual_frame_duration) / 60000)
+        sidecar['DecayFactor'] = decay_factor
+        sidecar['FrameTimesStart'] = frame_start
+        sidecar['FrameDuration'] = frame_duration
+        sidecar['FrameTimesEnd'] = frame_end
+        sidecar['SliceThickness'] = float(self.header[0].get('SliceThickness', None))
+        sidecar['ImageOrientationPatientDICOM'] = list(self.header[0].get('ImageOrientationPatient', []))
+        sidecar['ConversionSoftwareVersion'] = 'v1.0.20220505'
+        sidecar['PyPET2NIFTIVersion'] = '0.1'
         if self.apply_filter:
-            sidecar_template_custom['Smoothed'] = 'yes'
-            sidecar_template_custom['FilterSize'] = self.filter_size
+            sidecar['Smoothed'] = 'yes'
+            sidecar['FilterSize'] = self.filter_size
         else:
-            sidecar_template_custom['Smoothed'] = 'no'
-            sidecar_template_custom['FilterSize'] = []
-        self.write_json(sidecar_template_custom)
+            sidecar['Smoothed'] = 'no'
+            sidecar['FilterSize'] = []
+        self.write_json(sidecar)
         return None
 
     def ecat_json(self):
@@ -556,36 +822,40 @@ class Converter:
         Returns:
             None
         """
-        sidecar_template_custom['ManufacturersModelName'] = self.header.get('system_type', None)
-        sidecar_template_custom['SoftwareVersions'] = self.header.get('sw_version', None)
-        sidecar_template_custom['SeriesDescription'] = self.header.get('study_description', None)
-        sidecar_template_custom['ProtocolName'] = self.header.get('study_description', None)
-        sidecar_template_custom['ImageType'] = ['ORIGINAL', 'PRIMARY']
-        sidecar_template_custom['SeriesNumber'] = self.header.get('serial_number', None)
-        sidecar_template_custom['StudyDate'] = self.convertdatetime(self.header.get('scan_start_time', None))[:8]
-        sidecar_template_custom['AcquisitionTime'] = self.convertdatetime(self.header.get('scan_start_time', None))[8:]
-        sidecar_template_custom['Radiopharmaceutical'] = self.tracer
-        sidecar_template_custom['RadionuclidePositronFraction'] = ''
-        sidecar_template_custom['RadionuclideTotalDose'] = self.header.get('dosage', None)
-        sidecar_template_custom['RadionuclideHalfLife'] = self.header.get('isotope_halflife', None)
-        sidecar_template_custom['DoseCalibrationFactor'] = self.header.get('ecat_calibration_factor', None)
-        sidecar_template_custom['Units'] = self.header.get('data_units', None)
-        sidecar_template_custom['DecayCorrection'] = 'START'
-        sidecar_template_custom['AttenuationCorrectionMethod'] = ''
-        sidecar_template_custom['ReconstructionMethod'] = self.subheaders[0].get('annotation', '')
-        sidecar_template_custom['DecayFactor'] = [self.subheaders[i].get('decay_corr_fctr', 1) for i in range(len(self.subheaders))]
-        sidecar_template_custom['FrameTimesStart'] = [(self.subheaders[i].get('frame_start_time',0)) / 60000 for i in range(len(self.subheaders))]
-        sidecar_template_custom['FrameDuration'] = [(self.subheaders[i].get('frame_duration', 0)) / 60000 for i in range(len(self.subheaders))]
-        sidecar_template_custom['FrameTimesEnd'] = [(self.subheaders[i].get('frame_start_time',0) + self.subheaders[i].get('frame_duration', 0)) / 60000 for i in range(len(self.subheaders))]
-        sidecar_template_custom['SliceThickness'] = (self.subheaders[0].get('z_pixel_size', None)) * 10
-        sidecar_template_custom['ImageOrientationPatientDICOM'] = []
-        sidecar_template_custom['ConversionSoftwareVersion'] = 'v1.0.20220505'
-        sidecar_template_custom['PyPET2NIFTIVersion'] = '0.1'
+        sidecar = dict(sidecar_template_custom)
+        sidecar['ManufacturersModelName'] = self.header.get('system_type', None)
+        sidecar['SoftwareVersions'] = self.header.get('sw_version', None)
+        sidecar['SeriesDescription'] = self.header.get('study_description', None)
+        sidecar['ProtocolName'] = self.header.get('study_description', None)
+        sidecar['ImageType'] = ['ORIGINAL', 'PRIMARY']
+        sidecar['SeriesNumber'] = self.header.get('serial_number', None)
+        scan_start_time = self.convertdatetime(self.header.get('scan_start_time', None))
+        sidecar['StudyDate'] = scan_start_time[:8]
+        sidecar['AcquisitionTime'] = scan_start_time[8:]
+        sidecar['Radiopharmaceutical'] = self.tracer
+        sidecar['RadionuclidePositronFraction'] = ''
+        sidecar['RadionuclideTotalDose'] = self.header.get('dosage', None)
+        sidecar['RadionuclideHalfLife'] = self.header.get('isotope_halflife', None)
+        sidecar['DoseCalibrationFactor'] = self.header.get('ecat_calibration_factor', None)
+        sidecar['Units'] = self.header.get('data_units', None)
+        sidecar['DecayCorrection'] = 'START'
+        sidecar['AttenuationCorrectionMethod'] = ''
+        frame_start = self.subheaders['frame_start_time'].astype(np.float64)
+        frame_duration = self.subheaders['frame_duration'].astype(np.float64)
+        sidecar['ReconstructionMethod'] = self.subheaders['annotation'][0].item()
+        sidecar['DecayFactor'] = self.subheaders['decay_corr_fctr'].tolist()
+        sidecar['FrameTimesStart'] = (frame_start / 60000).tolist()
+        sidecar['FrameDuration'] = (frame_duration / 60000).tolist()
+        sidecar['FrameTimesEnd'] = ((frame_start + frame_duration) / 60000).tolist()
+        sidecar['SliceThickness'] = self.subheaders['z_pixel_size'][0].item() * 10
+        sidecar['ImageOrientationPatientDICOM'] = []
+        sidecar['ConversionSoftwareVersion'] = 'v1.0.20220505'
+        sidecar['PyPET2NIFTIVersion'] = '0.1'
         if self.apply_filter:
-            sidecar_template_custom['Smoothed'] = 'yes'
-            sidecar_template_custom['FilterSize'] = self.filter_size
+            sidecar['Smoothed'] = 'yes'
+            sidecar['FilterSize'] = self.filter_size
         else:
-            sidecar_template_custom['Smoothed'] = 'no'
-            sidecar_template_custom['FilterSize'] = []
-        self.write_json(sidecar_template_custom)
+            sidecar['Smoothed'] = 'no'
+            sidecar['FilterSize'] = []
+        self.write_json(sidecar)
         return None
@@ -6,11 +6,13 @@ is not a function or a true module. This is just two python dictionaries with ke
 
 * sidecar_template_full: a dict containing every PET BIDS field
 * sidecar_template_short: a dict containing only required PET BIDS fields
-* sidecar_template_custom: a dict containing only custom PET BIDS fields (BAI version)
+* sidecar_template_custom: a read-only mapping containing only custom PET BIDS fields (BAI version),
+  copy it with dict() before filling in values
 
 **Returns**     sidecar_template_full, sidecar_template_short, sidecar_template_custom
 
 """
+from types import MappingProxyType
 
 
 sidecar_template_full = {
@@ -113,7 +115,7 @@ sidecar_template_short = {
     "AttenuationCorrection": ""
 }
 
-sidecar_template_custom = {
+sidecar_template_custom = MappingProxyType({
     "Modality": "PT",
     "Manufacturer": "Siemens",
     "ManufacturersModelName": "",
@@ -145,4 +147,4 @@ sidecar_template_custom = {
     "ImageOrientationPatientDICOM": [],
     "ConversionSoftware": "dcm2niix",
     "ConversionSoftwareVersion": ""
-}
+})
@@ -42,4 +42,7 @@ philips = {
     'Allegro': [3, 3, 3],
     'GemGXL': [3, 3, 3],
     'Gem': [3, 3, 3]
-}
\ No newline at end of file
+}
+
+# All scanners in a single table for lookup by scanner type
+scanners = siemens | ge | philips
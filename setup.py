@@ -23,6 +23,9 @@ setup(
         'dcm2niix',
         'scipy'
     ],
+    extras_require={
+        'numba': ['numba'],
+    },
 
     # Entry point configuration
     entry_points={